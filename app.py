@@ -1,7 +1,11 @@
 import os
+import click
 from flask import Flask
 from routes.web import web
+from controllers.export_controller import EXPORT_FORMATS, write_daily_partitions
 from config.database import Base, engine
+from config.profiling import init_profiling
+from services.outbox_worker import OUTBOX_WORKERS, OutboxWorker
 from flask_cors import CORS
 
 app = Flask(__name__)
@@ -40,12 +44,49 @@ CORS(
     max_age=86400,
 )
 
+# Profiling per request (opsional, lihat config/profiling.py)
+init_profiling(app)
+
 # Buat tabel otomatis jika belum ada
 Base.metadata.create_all(bind=engine)
 
 # Daftarkan blueprint
 app.register_blueprint(web)
 
+
+# CLI: flask --app app export-orders --out exports --from 2024-01-01 --to 2024-01-31
+@app.cli.command("export-orders")
+@click.option("--out", "out_dir", default="exports", show_default=True, help="Folder tujuan partisi harian")
+@click.option("--format", "fmt", type=click.Choice(EXPORT_FORMATS), default="csv", show_default=True)
+@click.option("--from", "date_from", type=click.DateTime(formats=["%Y-%m-%d"]), default=None)
+@click.option("--to", "date_to", type=click.DateTime(formats=["%Y-%m-%d"]), default=None)
+def export_orders_command(out_dir, fmt, date_from, date_to):
+    """Export order + item ke satu file per hari."""
+    counts = write_daily_partitions(out_dir, fmt, date_from, date_to)
+    for day, total in counts.items():
+        click.echo(f"{day}: {total} baris")
+    click.echo(f"Selesai: {sum(counts.values())} baris dalam {len(counts)} partisi")
+
+
+# CLI: flask --app app outbox-worker (worker terpisah dari proses web)
+@app.cli.command("outbox-worker")
+@click.option("--workers", default=OUTBOX_WORKERS, show_default=True, help="Jumlah thread pemroses event")
+def outbox_worker_command(workers):
+    """Proses event outbox order (side-effect setelah order dibuat)."""
+    click.echo(f"Outbox worker berjalan dengan {workers} thread")
+    OutboxWorker(workers=workers).run_forever()
+
+
+# Worker in-process (opsional) bila tidak menjalankan proses worker terpisah.
+# Dinyalakan saat request pertama, sehingga hanya proses web yang menjalankannya
+# (bukan perintah CLI seperti outbox-worker / export-orders yang ikut meng-import app).
+if os.environ.get("OUTBOX_INPROCESS", "0") == "1":
+    inprocess_outbox = OutboxWorker()
+
+    @app.before_request
+    def _start_inprocess_outbox():
+        inprocess_outbox.start()
+
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
     
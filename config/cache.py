@@ -0,0 +1,208 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# Cache respons detail (order / customer), dikonfigurasi via environment variable:
+#   RESPONSE_CACHE_SQLITE  : path file SQLite sebagai cache bersama antar proses
+#   RESPONSE_CACHE_ENABLED : "1" paksa aktif (juga tanpa SQLite), "0" paksa mati
+#   RESPONSE_CACHE_SIZE    : jumlah maksimum entry di memori (LRU)
+#   RESPONSE_CACHE_TTL     : umur maksimum entry dalam detik (default 60)
+#
+# Cache hanya aktif secara default bila RESPONSE_CACHE_SQLITE diset. Tanpa itu versi
+# dan entry hanya ada di memori proses: invalidasi dari satu worker gunicorn tidak
+# sampai ke worker lain, sehingga dengan WEB_CONCURRENCY > 1 worker lain bisa
+# menyajikan data usang. Mode memori saja harus diaktifkan eksplisit dengan
+# RESPONSE_CACHE_ENABLED=1 (aman untuk satu worker).
+#
+# TTL membatasi umur data yang berubah di luar controller ini (mis. status order
+# yang diubah langsung di database) karena perubahan itu tidak menaikkan versi.
+#
+# Setiap entry disimpan bersama versinya ("<global>.<entity>"). Write ke entity
+# menaikkan versi entity tsb; perubahan menu menaikkan versi global karena
+# nama menu ikut tampil di detail order/customer.
+
+
+class _MemoryVersions:
+    def __init__(self):
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get_versions(self, *names):
+        return [self._versions.get(name, 0) for name in names]
+
+    def bump(self, name):
+        with self._lock:
+            self._versions[name] = self._versions.get(name, 0) + 1
+
+
+class _SQLiteBackend:
+    """Cache level-2 + tabel versi di file SQLite, dipakai bersama oleh semua worker gunicorn."""
+
+    PRUNE_EVERY = 100
+
+    def __init__(self, path, max_entries, ttl):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._sets = 0
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS cache_entry (key TEXT PRIMARY KEY, version TEXT NOT NULL, value TEXT NOT NULL, stored_at REAL NOT NULL)")
+        conn.execute("CREATE TABLE IF NOT EXISTS cache_version (name TEXT PRIMARY KEY, version INTEGER NOT NULL)")
+
+    def _conn(self):
+        # Satu koneksi per thread, dipakai ulang; autocommit (isolation_level=None)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def get_versions(self, *names):
+        placeholders = ", ".join("?" for _ in names)
+        rows = dict(self._conn().execute(f"SELECT name, version FROM cache_version WHERE name IN ({placeholders})", names).fetchall())
+        return [rows.get(name, 0) for name in names]
+
+    def bump(self, name):
+        self._conn().execute(
+            "INSERT INTO cache_version (name, version) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET version = version + 1",
+            (name,),
+        )
+
+    def get(self, key, version):
+        """Kembalikan (value, stored_at) bila entry cocok dan belum kedaluwarsa, selain itu None."""
+        row = self._conn().execute(
+            "SELECT value, stored_at FROM cache_entry WHERE key = ? AND version = ? AND stored_at > ?",
+            (key, version, time.time() - self.ttl),
+        ).fetchone()
+        return (json.loads(row[0]), row[1]) if row else None
+
+    def set(self, key, version, value):
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entry (key, version, value, stored_at) VALUES (?, ?, ?, ?)",
+            (key, version, json.dumps(value), time.time()),
+        )
+        self._sets += 1
+        if self._sets % self.PRUNE_EVERY == 0:
+            conn.execute("DELETE FROM cache_entry WHERE stored_at <= ?", (time.time() - self.ttl,))
+            conn.execute(
+                "DELETE FROM cache_entry WHERE key NOT IN "
+                "(SELECT key FROM cache_entry ORDER BY stored_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+
+class ResponseCache:
+    """LRU in-process (level-1) dengan backend bersama opsional (level-2)."""
+
+    def __init__(self, max_entries=1024, sqlite_path=None, enabled=True, ttl=60):
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._shared = _SQLiteBackend(sqlite_path, max_entries, ttl) if sqlite_path else None
+        self._versions = self._shared or _MemoryVersions()
+        self.hits_memory = 0
+        self.hits_shared = 0
+        self.misses = 0
+
+    def _version(self, entity, entity_id):
+        global_version, entity_version = self._versions.get_versions("global", f"{entity}:{entity_id}")
+        return f"{global_version}.{entity_version}"
+
+    def get_or_set(self, entity, entity_id, loader, shared=True):
+        """Kembalikan payload dari cache, atau panggil ``loader()`` dan simpan hasilnya.
+
+        ``loader`` mengembalikan None bila data tidak ada; hasil None tidak di-cache.
+        ``shared=False`` menyimpan payload hanya di memori (tidak ditulis ke file SQLite),
+        untuk data sensitif; versinya tetap dibaca dari backend bersama.
+        """
+        if not self.enabled:
+            return loader()
+
+        key = f"{entity}:{entity_id}"
+        # Versi dibaca sebelum load: write yang terjadi selama load membuat entry ini langsung usang
+        version = self._version(entity, entity_id)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == version and entry[2] > time.time():
+                self._entries.move_to_end(key)
+                self.hits_memory += 1
+                return entry[1]
+
+        if self._shared and shared:
+            found = self._shared.get(key, version)
+            if found is not None:
+                value, stored_at = found
+                self._store(key, version, value, stored_at + self.ttl)
+                with self._lock:
+                    self.hits_shared += 1
+                return value
+
+        value = loader()
+        with self._lock:
+            self.misses += 1
+        if value is not None:
+            self._store(key, version, value, time.time() + self.ttl)
+            if self._shared and shared:
+                self._shared.set(key, version, value)
+        return value
+
+    def _store(self, key, version, value, expires_at):
+        with self._lock:
+            self._entries[key] = (version, value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, entity, *entity_ids):
+        """Naikkan versi entity (dipanggil setelah commit write)."""
+        for entity_id in entity_ids:
+            key = f"{entity}:{entity_id}"
+            self._versions.bump(key)
+            with self._lock:
+                self._entries.pop(key, None)
+
+    def invalidate_all(self):
+        """Naikkan versi global, misalnya setelah perubahan menu."""
+        self._versions.bump("global")
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            hits = self.hits_memory + self.hits_shared
+            lookups = hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "backend": "memory+sqlite" if self._shared else "memory",
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits_memory": self.hits_memory,
+                "hits_shared": self.hits_shared,
+                "misses": self.misses,
+                "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def _cache_from_env(environ):
+    sqlite_path = environ.get("RESPONSE_CACHE_SQLITE") or None
+    enabled_env = environ.get("RESPONSE_CACHE_ENABLED", "")
+    return ResponseCache(
+        max_entries=int(environ.get("RESPONSE_CACHE_SIZE", 1024)),
+        sqlite_path=sqlite_path,
+        enabled=enabled_env == "1" or (sqlite_path is not None and enabled_env != "0"),
+        ttl=float(environ.get("RESPONSE_CACHE_TTL", 60)),
+    )
+
+
+response_cache = _cache_from_env(os.environ)
@@ -0,0 +1,136 @@
+import cProfile
+import hmac
+import itertools
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from flask import g, request
+
+# Profiling per request (opsional), dikonfigurasi via environment variable:
+#   PROFILE_TOKEN        : request dengan header X-Profile-Token yang cocok selalu diprofil
+#   PROFILE_SAMPLE_RATE  : persentase acak request yang diprofil (0.0 - 1.0)
+#   PROFILE_MODE         : "sampling" (folded stacks, default) atau "cprofile" (.prof)
+#   PROFILE_INTERVAL_MS  : jarak antar sample untuk mode sampling
+#   PROFILE_DIR          : folder output
+#   PROFILE_MAX_FILES    : jumlah file profil yang disimpan; file tertua dihapus (default 200)
+# Bila PROFILE_TOKEN dan PROFILE_SAMPLE_RATE kosong, hook tidak dipasang sama sekali.
+
+PROFILE_HEADER = "X-Profile-Token"
+
+# Nomor urut per proses agar nama file unik walau request berulang dalam detik & thread yang sama
+_profile_seq = itertools.count(1)
+
+
+class _StackSampler(threading.Thread):
+    """Ambil stack thread request secara periodik dalam format folded (flamegraph.pl / speedscope)."""
+
+    def __init__(self, thread_id, interval):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+def _should_profile(token, sample_rate):
+    header = request.headers.get(PROFILE_HEADER)
+    if token and header and hmac.compare_digest(header.encode(), token.encode()):
+        return True
+    return sample_rate > 0 and random.random() < sample_rate
+
+
+def _prune(out_dir, max_files):
+    """Hapus file profil tertua agar PROFILE_DIR tidak tumbuh tanpa batas."""
+    paths = [os.path.join(out_dir, name) for name in os.listdir(out_dir) if name.endswith((".prof", ".folded"))]
+    if len(paths) <= max_files:
+        return
+    paths.sort(key=lambda path: (os.path.getmtime(path), path))
+    for path in paths[:len(paths) - max_files]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def init_profiling(app):
+    token = os.environ.get("PROFILE_TOKEN", "")
+    sample_rate = float(os.environ.get("PROFILE_SAMPLE_RATE", 0) or 0)
+    if not token and sample_rate <= 0:
+        return
+
+    mode = os.environ.get("PROFILE_MODE", "sampling")
+    interval = float(os.environ.get("PROFILE_INTERVAL_MS", 5)) / 1000.0
+    out_dir = os.environ.get("PROFILE_DIR", "profiles")
+    max_files = int(os.environ.get("PROFILE_MAX_FILES", 200))
+    os.makedirs(out_dir, exist_ok=True)
+
+    @app.before_request
+    def _start_profile():
+        if not _should_profile(token, sample_rate):
+            return
+        endpoint = (request.endpoint or "unknown").replace(".", "_")
+        g.profile_name = f"{time.strftime('%Y%m%d-%H%M%S')}-{endpoint}-{os.getpid()}-{next(_profile_seq):06d}"
+        if mode == "cprofile":
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                # Python 3.12+: hanya satu cProfile aktif per proses, lewati request ini
+                g.pop("profile_name")
+                return
+            g.profiler = profiler
+        else:
+            sampler = _StackSampler(threading.get_ident(), interval)
+            sampler.start()
+            g.profiler = sampler
+
+    def _finish():
+        """Hentikan profiler request ini; kembalikan nama file bila ada yang ditulis."""
+        profiler = g.pop("profiler", None)
+        if profiler is None:
+            return None
+        name = g.pop("profile_name")
+        if isinstance(profiler, cProfile.Profile):
+            profiler.disable()
+            profiler.dump_stats(os.path.join(out_dir, f"{name}.prof"))
+        else:
+            profiler.stop()
+            # Request lebih singkat dari PROFILE_INTERVAL_MS tidak punya sample: jangan tulis
+            # file kosong yang ikut dihitung PROFILE_MAX_FILES dan menggeser profil asli
+            if not profiler.stacks:
+                return None
+            with open(os.path.join(out_dir, f"{name}.folded"), "w", encoding="utf-8") as f:
+                for stack, count in profiler.stacks.items():
+                    f.write(f"{stack} {count}\n")
+        _prune(out_dir, max_files)
+        return name
+
+    @app.after_request
+    def _stop_profile(response):
+        name = _finish()
+        if name:
+            response.headers["X-Profile-Id"] = name
+        return response
+
+    @app.teardown_request
+    def _cleanup_profile(exc):
+        # after_request tidak berjalan bila view melempar exception yang tidak tertangani
+        _finish()
@@ -6,6 +6,7 @@ from models.menu_model import Menu
 from models.order_item_model import OrderItem
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
+from config.cache import response_cache
 
 
 # --- GET: Semua customer + order aktif ---
@@ -95,13 +96,13 @@ def login_customer():
         }
     }), 200
 
-# --- GET: Customer berdasarkan ID ---
-def get_customer_by_id(customer_id):
+def _customer_detail(customer_id):
+    """Payload detail customer + order, atau None bila customer tidak ada."""
     db: Session = SessionLocal()
     try:
         customer = db.query(Customer).filter(Customer.customer_id == customer_id).first()
         if not customer:
-            return jsonify({"message": "Customer tidak ditemukan"}), 404
+            return None
 
         orders = db.query(Order).filter(Order.customer_id == customer_id).all()
         order_list = []
@@ -135,7 +136,7 @@ def get_customer_by_id(customer_id):
                 "items": items
             })
 
-        return jsonify({
+        return {
             "customer_id": customer.customer_id,
             "name_customer": customer.name_customer,
             "email": customer.email,
@@ -143,11 +144,20 @@ def get_customer_by_id(customer_id):
             "phone": customer.phone,
             "address": customer.address,
             "orders": order_list,
-        })
+        }
     finally:
         db.close()
 
 
+# --- GET: Customer berdasarkan ID ---
+def get_customer_by_id(customer_id):
+    # Payload berisi password: jangan ditulis ke cache bersama (file SQLite)
+    customer = response_cache.get_or_set("customer", customer_id, lambda: _customer_detail(customer_id), shared=False)
+    if not customer:
+        return jsonify({"message": "Customer tidak ditemukan"}), 404
+    return jsonify(customer)
+
+
 
 # --- POST: Tambah customer baru ---
 def add_customer():
@@ -221,6 +231,7 @@ def update_customer(customer_id):
 
         db.commit()
         db.refresh(customer)
+        response_cache.invalidate("customer", customer_id)
 
         return jsonify({
             "message": "Customer berhasil diperbarui",
@@ -247,6 +258,7 @@ def delete_customer(customer_id):
 
         db.delete(customer)
         db.commit()
+        response_cache.invalidate("customer", customer_id)
 
         return jsonify({"message": "Customer berhasil dihapus"})
     finally:
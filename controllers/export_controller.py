@@ -0,0 +1,194 @@
+import csv
+import io
+import json
+import os
+from datetime import datetime, timedelta
+from decimal import Decimal
+from flask import Response, jsonify, request, stream_with_context
+from config.database import SessionLocal
+from models.order_model import Order
+from models.menu_model import Menu
+from models.order_item_model import OrderItem
+from sqlalchemy.orm import Session
+
+# Kolom hasil export: satu baris per order item (order tanpa item tetap muncul)
+EXPORT_COLUMNS = [
+    "order_id",
+    "customer_id",
+    "order_date",
+    "payment_method",
+    "status",
+    "total_price",
+    "order_item_id",
+    "menu_id",
+    "menu_name",
+    "quantity",
+    "price",
+    "subtotal",
+]
+
+EXPORT_FORMATS = ("csv", "ndjson")
+
+# Jumlah baris yang diambil per batch dari server-side cursor
+EXPORT_BATCH_SIZE = 1000
+
+
+def _parse_date(value):
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+def _money(value):
+    # Kolom uang Numeric(12, 2): tulis sebagai teks 2 desimal, bukan float
+    return str(Decimal(value).quantize(Decimal("0.01"))) if value is not None else None
+
+
+def iter_order_rows(db: Session, date_from=None, date_to=None):
+    """Yield baris export (dict) secara berurutan per tanggal order.
+
+    Query memakai server-side cursor (stream_results + yield_per) sehingga
+    memori tetap konstan berapapun jumlah order. ``date_to`` inklusif.
+    """
+    query = (
+        db.query(
+            Order.order_id,
+            Order.customer_id,
+            Order.order_date,
+            Order.payment_method,
+            Order.status,
+            Order.total_price,
+            OrderItem.order_item_id,
+            OrderItem.menu_id,
+            Menu.name,
+            OrderItem.quantity,
+            OrderItem.price,
+            OrderItem.subtotal,
+        )
+        .outerjoin(OrderItem, OrderItem.order_id == Order.order_id)
+        .outerjoin(Menu, OrderItem.menu_id == Menu.id_menu)
+    )
+    if date_from is not None:
+        query = query.filter(Order.order_date >= date_from)
+    if date_to is not None:
+        query = query.filter(Order.order_date < date_to + timedelta(days=1))
+
+    query = (
+        query.order_by(Order.order_date, Order.order_id, OrderItem.order_item_id)
+        .execution_options(stream_results=True)
+        .yield_per(EXPORT_BATCH_SIZE)
+    )
+
+    for row in query:
+        yield {
+            "order_id": row.order_id,
+            "customer_id": row.customer_id,
+            "order_date": row.order_date.strftime("%Y-%m-%d %H:%M:%S") if row.order_date else None,
+            "payment_method": row.payment_method,
+            "status": row.status,
+            "total_price": _money(row.total_price),
+            "order_item_id": row.order_item_id,
+            "menu_id": row.menu_id,
+            "menu_name": row.name,
+            "quantity": row.quantity,
+            "price": _money(row.price),
+            "subtotal": _money(row.subtotal),
+        }
+
+
+class _RowEncoder:
+    """Ubah baris export menjadi teks CSV / NDJSON.
+
+    Untuk CSV satu DictWriter dan buffer dipakai ulang selama satu stream,
+    bukan dibuat ulang per baris.
+    """
+
+    def __init__(self, fmt):
+        self.fmt = fmt
+        if fmt == "csv":
+            self._buf = io.StringIO()
+            self._writer = csv.DictWriter(self._buf, fieldnames=EXPORT_COLUMNS)
+
+    def _drain(self):
+        value = self._buf.getvalue()
+        self._buf.seek(0)
+        self._buf.truncate(0)
+        return value
+
+    def header(self):
+        if self.fmt != "csv":
+            return ""
+        self._writer.writeheader()
+        return self._drain()
+
+    def encode(self, row):
+        if self.fmt != "csv":
+            return json.dumps(row) + "\n"
+        self._writer.writerow(row)
+        return self._drain()
+
+
+# --- GET: Export order + item (streaming CSV / NDJSON) ---
+def export_orders():
+    fmt = request.args.get("format", "csv").lower()
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"message": "format harus csv atau ndjson"}), 400
+
+    try:
+        date_from = _parse_date(request.args["from"]) if request.args.get("from") else None
+        date_to = _parse_date(request.args["to"]) if request.args.get("to") else None
+    except ValueError:
+        return jsonify({"message": "Format tanggal harus YYYY-MM-DD"}), 400
+
+    def generate():
+        db: Session = SessionLocal()
+        try:
+            encoder = _RowEncoder(fmt)
+            header = encoder.header()
+            if header:
+                yield header
+            for row in iter_order_rows(db, date_from, date_to):
+                yield encoder.encode(row)
+        finally:
+            db.close()
+
+    mimetype = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    filename = f"orders.{fmt}"
+    return Response(
+        stream_with_context(generate()),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
+def write_daily_partitions(out_dir, fmt="csv", date_from=None, date_to=None):
+    """Tulis export ke satu file per hari: ``<out_dir>/<YYYY-MM-DD>/orders.<fmt>``.
+
+    Baris sudah terurut per tanggal, jadi hanya satu file yang terbuka pada
+    satu waktu. Mengembalikan dict {tanggal: jumlah baris}.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError("format harus csv atau ndjson")
+
+    counts = {}
+    current_day = None
+    handle = None
+    encoder = _RowEncoder(fmt)
+    db: Session = SessionLocal()
+    try:
+        for row in iter_order_rows(db, date_from, date_to):
+            day = row["order_date"][:10] if row["order_date"] else "unknown"
+            if day != current_day:
+                if handle:
+                    handle.close()
+                partition_dir = os.path.join(out_dir, day)
+                os.makedirs(partition_dir, exist_ok=True)
+                handle = open(os.path.join(partition_dir, f"orders.{fmt}"), "w", newline="", encoding="utf-8")
+                handle.write(encoder.header())
+                current_day = day
+                counts[day] = 0
+            handle.write(encoder.encode(row))
+            counts[day] += 1
+    finally:
+        if handle:
+            handle.close()
+        db.close()
+    return counts
@@ -1,7 +1,10 @@
 from typing import Optional
 from flask import jsonify, request
+from sqlalchemy.exc import IntegrityError
 from config import database
 from models.menu_model import Menu
+from models.order_item_model import OrderItem
+from config.cache import response_cache
 
 
 def _serialize_menu(item: Menu) -> dict:
@@ -69,6 +72,8 @@ def update_menu(menu_id: int):
 				setattr(item, k, body[k])
 		db.commit()
 		db.refresh(item)
+		# nama menu ikut tampil di detail order/customer yang di-cache
+		response_cache.invalidate_all()
 		return jsonify(_serialize_menu(item))
 	finally:
 		db.close()
@@ -82,6 +87,147 @@ def delete_menu(menu_id: int):
 			return jsonify({"message": "Menu tidak ditemukan"}), 404
 		db.delete(item)
 		db.commit()
+		response_cache.invalidate_all()
 		return jsonify({"message": "Menu dihapus"})
 	finally:
 		db.close()
+
+
+def _menu_field_error(entry: dict) -> Optional[str]:
+	"""Pesan error bila ada field menu dengan tipe yang salah, selain itu None."""
+	for k in ("name", "category", "image_url"):
+		if k in entry and not isinstance(entry[k], str):
+			return f"Field '{k}' harus berupa teks"
+	if "price" in entry and (isinstance(entry["price"], bool) or not isinstance(entry["price"], int)):
+		return "Field 'price' harus angka bulat"
+	return None
+
+
+def _parse_id(value) -> Optional[int]:
+	"""id_menu hanya boleh int atau string angka; float dll ditolak (bukan dibulatkan)."""
+	if isinstance(value, int) and not isinstance(value, bool):
+		return value
+	if isinstance(value, str) and value.isdigit():
+		return int(value)
+	return None
+
+
+def bulk_menus():
+	"""Flask view: upsert dan hapus banyak menu dalam satu transaksi.
+
+	Body: {"upsert": [{"id_menu"?, "name", "price", "category", "image_url"}, ...], "delete": [id_menu, ...]}
+
+	Upsert mencocokkan id_menu bila ada, selain itu name. Karena name tidak unik,
+	name yang cocok dengan lebih dari satu menu ditolak (409); gunakan id_menu.
+	Satu menu hanya boleh muncul sekali di 'upsert' dan tidak boleh sekaligus
+	dihapus dalam batch yang sama.
+	"""
+	if not request.is_json:
+		return jsonify({"message": "Gunakan format JSON"}), 400
+	body = request.json
+	if not isinstance(body, dict):
+		return jsonify({"message": "Body harus berupa objek JSON"}), 400
+	upserts = body.get("upsert", [])
+	deletes = body.get("delete", [])
+	if not isinstance(upserts, list) or not isinstance(deletes, list):
+		return jsonify({"message": "Field 'upsert' dan 'delete' harus berupa daftar"}), 400
+
+	for u in upserts:
+		if not isinstance(u, dict):
+			return jsonify({"message": "Setiap item 'upsert' harus berupa objek", "item": u}), 400
+		if u.get("id_menu") is not None and _parse_id(u["id_menu"]) is None:
+			return jsonify({"message": "id_menu harus angka", "item": u}), 400
+		error = _menu_field_error(u)
+		if error:
+			return jsonify({"message": error, "item": u}), 400
+	delete_ids = [_parse_id(i) for i in deletes]
+	if None in delete_ids:
+		return jsonify({"message": "Isi 'delete' harus berupa id_menu (angka)"}), 400
+	delete_ids = set(delete_ids)
+
+	fields = ("name", "price", "category", "image_url")
+	db = database.SessionLocal()
+	try:
+		# Ambil menu yang sudah ada sekaligus (by id dan by name) agar tidak query per item
+		ids = {_parse_id(u["id_menu"]) for u in upserts if u.get("id_menu") is not None}
+		names = {u["name"] for u in upserts if u.get("id_menu") is None and u.get("name")}
+		by_id = {}
+		by_name = {}
+		if ids:
+			by_id = {m.id_menu: m for m in db.query(Menu).filter(Menu.id_menu.in_(ids))}
+		if names:
+			for m in db.query(Menu).filter(Menu.name.in_(names)):
+				by_name.setdefault(m.name, []).append(m)
+			ambiguous = sorted(n for n, rows in by_name.items() if len(rows) > 1)
+			if ambiguous:
+				return jsonify({"message": "Nama menu cocok dengan lebih dari satu menu, gunakan id_menu", "names": ambiguous}), 409
+
+		created, updated = [], []
+		touched = set()
+		for u in upserts:
+			if u.get("id_menu") is not None:
+				item = by_id.get(_parse_id(u["id_menu"]))
+				if not item:
+					db.rollback()
+					return jsonify({"message": f"Menu dengan id {u['id_menu']} tidak ditemukan"}), 404
+			else:
+				item = (by_name.get(u.get("name")) or [None])[0]
+
+			if item is not None:
+				if id(item) in touched:
+					db.rollback()
+					return jsonify({"message": "Menu yang sama muncul lebih dari sekali dalam batch", "item": u}), 400
+				touched.add(id(item))
+				for k in fields:
+					if k in u:
+						setattr(item, k, u[k])
+				updated.append(item)
+			else:
+				if not all(k in u for k in fields):
+					db.rollback()
+					return jsonify({"message": "Data tidak lengkap", "item": u}), 400
+				item = Menu(**{k: u[k] for k in fields})
+				db.add(item)
+				by_name[item.name] = [item]
+				touched.add(id(item))
+				created.append(item)
+
+		conflict = sorted({m.id_menu for m in updated} & delete_ids)
+		if conflict:
+			db.rollback()
+			return jsonify({"message": "Menu tidak boleh di-upsert dan dihapus dalam batch yang sama", "ids": conflict}), 400
+
+		deleted = 0
+		if delete_ids:
+			in_use = sorted(
+				r.menu_id for r in db.query(OrderItem.menu_id).filter(OrderItem.menu_id.in_(delete_ids)).distinct()
+			)
+			if in_use:
+				db.rollback()
+				return jsonify({"message": "Menu masih dipakai order, tidak bisa dihapus", "ids": in_use}), 409
+			# flush upsert dulu (autoflush mati) sebelum DELETE massal
+			db.flush()
+			deleted = (
+				db.query(Menu)
+				.filter(Menu.id_menu.in_(delete_ids))
+				.delete(synchronize_session=False)
+			)
+
+		# flush dulu agar id baru tersedia, serialisasi sebelum commit meng-expire objek
+		db.flush()
+		result = {
+			"created": [_serialize_menu(m) for m in created],
+			"updated": [_serialize_menu(m) for m in updated],
+			"deleted": deleted,
+		}
+		db.commit()
+		# satu invalidasi untuk seluruh batch
+		if updated or deleted:
+			response_cache.invalidate_all()
+		return jsonify(result)
+	except IntegrityError:
+		# order baru bisa saja merujuk menu di antara pengecekan dan DELETE
+		db.rollback()
+		return jsonify({"message": "Menu masih dipakai order, tidak bisa dihapus", "ids": sorted(delete_ids)}), 409
+	finally:
+		db.close()
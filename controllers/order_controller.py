@@ -4,7 +4,10 @@ from models.order_model import Order
 from models.menu_model import Menu
 from models.order_item_model import OrderItem
 from sqlalchemy.orm import Session
+from services.outbox_worker import enqueue_event, notify
+from config.cache import response_cache
 from datetime import datetime
+from decimal import Decimal
 
 # --- GET: Semua order (opsional filter per customer) ---
 def get_all_order():
@@ -27,9 +30,9 @@ def get_all_order():
                 items.append({
                     "menu_id": menu.id_menu,
                     "menu_name": menu.name,
-                    "price": oi.price,
+                    "price": float(oi.price),
                     "quantity": oi.quantity,
-                    "subtotal": oi.subtotal,
+                    "subtotal": float(oi.subtotal),
                 })
 
             # Format tanggal dengan konsisten
@@ -50,13 +53,13 @@ def get_all_order():
     finally:
         db.close()
 
-# --- GET: Order berdasarkan ID ---
-def get_order_by_id(order_id):
+def _order_detail(order_id):
+    """Payload detail order, atau None bila order tidak ada."""
     db: Session = SessionLocal()
     try:
         order = db.query(Order).filter(Order.order_id == order_id).first()
         if not order:
-            return jsonify({"message": "Order tidak ditemukan"}), 404
+            return None
 
         order_items = (
             db.query(OrderItem, Menu)
@@ -77,7 +80,7 @@ def get_order_by_id(order_id):
 
         formatted_date = order.order_date.strftime("%Y-%m-%d %H:%M:%S") if order.order_date else None
 
-        return jsonify({
+        return {
             "order_id": order.order_id,
             "customer_id": order.customer_id,
             "total_price": float(order.total_price),
@@ -85,13 +88,22 @@ def get_order_by_id(order_id):
             "status": order.status,
             "order_date": formatted_date,
             "items": items
-        }), 200
-    except Exception as e:
-        return jsonify({"message": "Terjadi kesalahan saat mengambil order", "error": str(e)}), 500
+        }
     finally:
         db.close()
 
 
+# --- GET: Order berdasarkan ID ---
+def get_order_by_id(order_id):
+    try:
+        order = response_cache.get_or_set("order", order_id, lambda: _order_detail(order_id))
+        if not order:
+            return jsonify({"message": "Order tidak ditemukan"}), 404
+        return jsonify(order), 200
+    except Exception as e:
+        return jsonify({"message": "Terjadi kesalahan saat mengambil order", "error": str(e)}), 500
+
+
 # --- POST: Buat order dari daftar item (items) ---
 def create_order():
     if not request.is_json:
@@ -117,7 +129,8 @@ def create_order():
 
         items_in = body["items"]
 
-        total_price = 0.0
+        # Hitung uang dengan Decimal agar sama persis dengan kolom Numeric(12, 2)
+        total_price = Decimal("0")
         order_items_to_create = []
 
         for it in items_in:
@@ -134,7 +147,7 @@ def create_order():
             if not menu:
                 return jsonify({"message": f"Menu dengan id {it['menu_id']} tidak ditemukan"}), 400
 
-            price = float(menu.price)
+            price = Decimal(menu.price)
             subtotal = price * qty
             total_price += subtotal
             order_items_to_create.append({"menu_id": menu.id_menu, "quantity": qty, "price": price, "subtotal": subtotal})
@@ -149,8 +162,8 @@ def create_order():
             order_date=datetime.utcnow()
         )
         db.add(new_order)
-        db.commit()
-        db.refresh(new_order)
+        # flush untuk mendapatkan order_id tanpa commit terpisah
+        db.flush()
 
         # Buat OrderItem rows
         items_response = []
@@ -159,7 +172,17 @@ def create_order():
             db.add(new_oi)
             items_response.append({"menu_id": oi["menu_id"], "quantity": oi["quantity"], "price": oi["price"], "subtotal": oi["subtotal"]})
 
+        # Side-effect (struk, tiket dapur, analytics) dicatat di outbox dalam transaksi yang sama
+        enqueue_event(db, new_order.order_id, "order.created", {
+            "customer_id": customer_id,
+            "total_price": str(total_price),
+            "payment_method": new_order.payment_method,
+            "item_count": len(items_response),
+        })
+
         db.commit()
+        notify()
+        response_cache.invalidate("customer", customer_id)
 
         return jsonify({
             "order_id": new_order.order_id,
@@ -202,6 +225,8 @@ def update_order(order_id):
 
         db.commit()
         db.refresh(order_item)
+        response_cache.invalidate("order", order_id)
+        response_cache.invalidate("customer", order_item.customer_id)
         return jsonify({
             "message": "Metode pembayaran berhasil diperbarui",
             "order_id": order_item.order_id,
@@ -224,8 +249,11 @@ def delete_order(order_id):
             return jsonify({"message": "Order tidak ditemukan"}), 404
 
         # delete order -> OrderItem rows will be removed by cascade
+        customer_id = order_item.customer_id
         db.delete(order_item)
         db.commit()
+        response_cache.invalidate("order", order_id)
+        response_cache.invalidate("customer", customer_id)
         return jsonify({"message": "Order berhasil dihapus"}), 200
     except Exception as e:
         db.rollback()
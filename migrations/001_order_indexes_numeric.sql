@@ -0,0 +1,24 @@
+-- Index untuk kolom join/filter di order_controller & customer_controller,
+-- serta harga dari Float ke Numeric(12, 2) agar perhitungan uang eksak.
+-- Jalankan sekali pada database yang sudah ada (PostgreSQL):
+--   psql "$DATABASE_URL" -f migrations/001_order_indexes_numeric.sql
+-- Database baru sudah mendapat skema ini lewat Base.metadata.create_all.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_order_item_order_id_menu_id ON order_item (order_id, menu_id);
+CREATE INDEX IF NOT EXISTS ix_order_item_menu_id ON order_item (menu_id);
+CREATE INDEX IF NOT EXISTS ix_order_customer_id ON "order" (customer_id);
+CREATE INDEX IF NOT EXISTS ix_order_order_date ON "order" (order_date);
+
+ALTER TABLE order_item
+    ALTER COLUMN price TYPE NUMERIC(12, 2) USING ROUND(price::numeric, 2),
+    ALTER COLUMN subtotal TYPE NUMERIC(12, 2) USING ROUND(subtotal::numeric, 2);
+
+ALTER TABLE "order"
+    ALTER COLUMN total_price TYPE NUMERIC(12, 2) USING ROUND(total_price::numeric, 2);
+
+COMMIT;
+
+ANALYZE order_item;
+ANALYZE "order";
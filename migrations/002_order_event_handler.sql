@@ -0,0 +1,11 @@
+-- Outbox: satu baris order_event per handler (side-effect), bukan per event.
+-- Jalankan sekali pada database yang sudah punya tabel order_event (PostgreSQL):
+--   psql "$DATABASE_URL" -f migrations/002_order_event_handler.sql
+
+BEGIN;
+
+ALTER TABLE order_event ADD COLUMN IF NOT EXISTS handler VARCHAR(100);
+UPDATE order_event SET handler = 'log_order_created' WHERE handler IS NULL;
+ALTER TABLE order_event ALTER COLUMN handler SET NOT NULL;
+
+COMMIT;
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from config.database import Base
+from datetime import datetime
+
+
+class OrderEvent(Base):
+    """Outbox: satu baris per side-effect (handler) order, diproses worker di luar request."""
+
+    __tablename__ = "order_event"
+
+    event_id = Column(Integer, primary_key=True, autoincrement=True)
+    order_id = Column(Integer, ForeignKey("order.order_id", ondelete="CASCADE"), nullable=False, index=True)
+    event_type = Column(String(50), nullable=False)
+    # Nama handler yang dijalankan untuk baris ini; retry hanya mengulang handler ini
+    handler = Column(String(100), nullable=False)
+    payload = Column(Text, nullable=False, default="{}")
+    # pending -> processing -> done / failed (kembali ke pending bila di-retry)
+    status = Column(String(20), nullable=False, default="pending", index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    available_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<OrderEvent(event_id={self.event_id}, order_id={self.order_id}, type={self.event_type}, handler={self.handler}, status={self.status})>"
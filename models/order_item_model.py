@@ -1,17 +1,21 @@
-from sqlalchemy import Column, Integer, Float, ForeignKey
+from sqlalchemy import Column, Integer, Numeric, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from config.database import Base
 
 
 class OrderItem(Base):
     __tablename__ = "order_item"
+    # Join order -> item -> menu selalu filter order_id lalu ambil menu_id
+    __table_args__ = (
+        Index("ix_order_item_order_id_menu_id", "order_id", "menu_id"),
+    )
 
     order_item_id = Column(Integer, primary_key=True, autoincrement=True)
     order_id = Column(Integer, ForeignKey("order.order_id"), nullable=False)
-    menu_id = Column(Integer, ForeignKey("menu.id_menu"), nullable=False)
+    menu_id = Column(Integer, ForeignKey("menu.id_menu"), nullable=False, index=True)
     quantity = Column(Integer, nullable=False, default=1)
-    price = Column(Float, nullable=False)
-    subtotal = Column(Float, nullable=False)
+    price = Column(Numeric(12, 2), nullable=False)
+    subtotal = Column(Numeric(12, 2), nullable=False)
 
     # relationships
     order = relationship("Order", back_populates="order_items")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Numeric, String, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from config.database import Base
 from datetime import datetime
@@ -7,11 +7,11 @@ class Order(Base):
     __tablename__ = "order"
 
     order_id = Column(Integer, primary_key=True, autoincrement=True)
-    customer_id = Column(Integer, ForeignKey("customer.customer_id"), nullable=False)
-    total_price = Column(Float, nullable=False)
+    customer_id = Column(Integer, ForeignKey("customer.customer_id"), nullable=False, index=True)
+    total_price = Column(Numeric(12, 2), nullable=False)
     payment_method = Column(String(50), nullable=False)
     status = Column(String(50), nullable=False, default="pending")
-    order_date = Column(DateTime, default=datetime.utcnow)
+    order_date = Column(DateTime, default=datetime.utcnow, index=True)
 
     # Relasi ke customer
     customer = relationship("Customer", back_populates="orders")
@@ -1,4 +1,5 @@
 from flask import Blueprint, jsonify
+from config.cache import response_cache
 
 # Import controllers
 from controllers.customer_controller import (
@@ -22,7 +23,9 @@ from controllers.menu_controller import (
     create_menu,
     update_menu,
     delete_menu,
+    bulk_menus,
 )
+from controllers.export_controller import export_orders
 
 
 # Definisikan blueprint
@@ -31,7 +34,7 @@ web = Blueprint("web", __name__)
 
 @web.route("/")
 def index():
-    return jsonify({"message": "API berjalan", "services": ["customers", "orders", "menus"]})
+    return jsonify({"message": "API berjalan", "services": ["customers", "orders", "menus", "exports"]})
 
 
 # --- CUSTOMER endpoints ---
@@ -54,8 +57,20 @@ web.route("/orders", methods=["POST"])(create_order)
 web.route("/menus", methods=["GET"])(get_all_menus)
 web.route("/menus/<int:menu_id>", methods=["GET"])(get_menu_by_id)
 web.route("/menus", methods=["POST"])(create_menu)
+web.route("/menus/bulk", methods=["PUT"])(bulk_menus)
 web.route("/menus/<int:menu_id>", methods=["PUT"])(update_menu)
 web.route("/menus/<int:menu_id>", methods=["DELETE"])(delete_menu)
 
+
+# --- EXPORT endpoints ---
+# ?from=YYYY-MM-DD&to=YYYY-MM-DD&format=csv|ndjson
+web.route("/exports/orders", methods=["GET"])(export_orders)
+
+
+# --- CACHE metrics ---
+@web.route("/cache/stats", methods=["GET"])
+def cache_stats():
+    return jsonify(response_cache.stats())
+
 # legacy/alias routes using singular /menu (some clients may call this)
 # (removed singular /menu aliases to keep API RESTful; use /menus)
@@ -0,0 +1,122 @@
+"""Benchmark export order pada dataset sintetis.
+
+Contoh (SQLite lokal, 1 juta order):
+    python scripts/bench_export.py --orders 1000000 --db /tmp/bench_export.db
+
+Dataset di-seed sekali; jalankan ulang dengan path --db yang sama untuk
+melewati seeding. Hasil: waktu dan peak RSS untuk stream CSV/NDJSON dan
+export partisi harian.
+"""
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _peak_rss_mb():
+    # ru_maxrss dalam KiB di Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def seed(engine, orders, chunk=20000):
+    from models.customer_model import Customer
+    from models.menu_model import Menu
+    from models.order_model import Order
+    from models.order_item_model import OrderItem
+
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1)
+    menus = [{"id_menu": i, "name": f"Menu {i}", "price": rng.randint(10, 60) * 1000, "category": "makanan", "image_url": ""} for i in range(1, 51)]
+    customers = [{"customer_id": i, "name_customer": f"Customer {i}", "email": f"c{i}@example.com", "password": "x", "address": "-", "phone": "-"} for i in range(1, 1001)]
+
+    with engine.begin() as conn:
+        conn.execute(Menu.__table__.insert(), menus)
+        conn.execute(Customer.__table__.insert(), customers)
+
+    item_id = 0
+    for first in range(1, orders + 1, chunk):
+        order_rows, item_rows = [], []
+        for order_id in range(first, min(first + chunk, orders + 1)):
+            total = 0
+            for _ in range(rng.randint(1, 3)):
+                menu = rng.choice(menus)
+                qty = rng.randint(1, 4)
+                item_id += 1
+                item_rows.append({"order_item_id": item_id, "order_id": order_id, "menu_id": menu["id_menu"], "quantity": qty, "price": menu["price"], "subtotal": menu["price"] * qty})
+                total += menu["price"] * qty
+            order_rows.append({
+                "order_id": order_id,
+                "customer_id": rng.randint(1, 1000),
+                "total_price": total,
+                "payment_method": "cash",
+                "status": "diantar",
+                "order_date": start + timedelta(seconds=rng.randint(0, 30 * 86400)),
+            })
+        with engine.begin() as conn:
+            conn.execute(Order.__table__.insert(), order_rows)
+            conn.execute(OrderItem.__table__.insert(), item_rows)
+    return item_id
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=1_000_000)
+    parser.add_argument("--db", default=os.path.join(tempfile.gettempdir(), "bench_export.db"))
+    args = parser.parse_args()
+
+    os.environ["DATABASE_URL"] = f"sqlite:///{args.db}"
+    from config.database import Base, SessionLocal, engine
+    from controllers.export_controller import _RowEncoder, iter_order_rows, write_daily_partitions
+    # Import semua model agar relasi & foreign key terdaftar sebelum create_all
+    from models.customer_model import Customer  # noqa: F401
+    from models.menu_model import Menu  # noqa: F401
+    from models.order_item_model import OrderItem  # noqa: F401
+    from models.order_model import Order
+
+    engine.echo = False
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    existing = db.query(Order).count()
+    db.close()
+    if not existing:
+        t0 = time.perf_counter()
+        items = seed(engine, args.orders)
+        print(f"seed: {args.orders} order, {items} item dalam {time.perf_counter() - t0:.1f} s")
+    else:
+        print(f"seed: dilewati, {existing} order sudah ada di {args.db}")
+
+    print(f"peak RSS sebelum export: {_peak_rss_mb():.1f} MiB")
+
+    for fmt in ("csv", "ndjson"):
+        db = SessionLocal()
+        try:
+            encoder = _RowEncoder(fmt)
+            t0 = time.perf_counter()
+            size = len(encoder.header())
+            rows = 0
+            for row in iter_order_rows(db):
+                size += len(encoder.encode(row))
+                rows += 1
+            elapsed = time.perf_counter() - t0
+        finally:
+            db.close()
+        print(f"stream {fmt}: {rows} baris, {size / 2**20:.1f} MiB dalam {elapsed:.1f} s "
+              f"({rows / elapsed:,.0f} baris/s), peak RSS {_peak_rss_mb():.1f} MiB")
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        t0 = time.perf_counter()
+        counts = write_daily_partitions(out_dir, "csv")
+        elapsed = time.perf_counter() - t0
+    print(f"partisi csv: {sum(counts.values())} baris dalam {len(counts)} file, {elapsed:.1f} s, "
+          f"peak RSS {_peak_rss_mb():.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from config.database import SessionLocal
+from models.order_event_model import OrderEvent
+
+logger = logging.getLogger(__name__)
+
+# Konfigurasi via environment variable
+OUTBOX_WORKERS = int(os.environ.get("OUTBOX_WORKERS", 4))
+OUTBOX_BATCH_SIZE = int(os.environ.get("OUTBOX_BATCH_SIZE", 20))
+OUTBOX_POLL_SECONDS = float(os.environ.get("OUTBOX_POLL_SECONDS", 2))
+OUTBOX_MAX_ATTEMPTS = int(os.environ.get("OUTBOX_MAX_ATTEMPTS", 5))
+# Event "processing" lebih lama dari ini dianggap worker-nya mati dan diambil ulang
+OUTBOX_LOCK_TIMEOUT = timedelta(seconds=int(os.environ.get("OUTBOX_LOCK_TIMEOUT", 300)))
+
+_handlers = {}
+_wakeup = threading.Event()
+
+
+def register_handler(event_type, name=None):
+    """Decorator: daftarkan fungsi ``handler(order_id, payload)`` untuk event_type.
+
+    Setiap handler mendapat baris outbox sendiri (nama default: nama fungsi),
+    sehingga kegagalan satu side-effect tidak mengulang side-effect lain.
+    """
+    def decorator(func):
+        _handlers.setdefault(event_type, {})[name or func.__name__] = func
+        return func
+    return decorator
+
+
+def enqueue_event(db: Session, order_id, event_type, payload=None):
+    """Tambahkan satu baris outbox per handler event_type pada transaksi ``db`` (belum di-commit)."""
+    now = datetime.utcnow()
+    events = []
+    for handler_name in _handlers.get(event_type, {}):
+        event = OrderEvent(
+            order_id=order_id,
+            event_type=event_type,
+            handler=handler_name,
+            payload=json.dumps(payload or {}),
+            status="pending",
+            attempts=0,
+            available_at=now,
+        )
+        db.add(event)
+        events.append(event)
+    return events
+
+
+def notify():
+    """Bangunkan worker in-process setelah commit agar tidak menunggu poll berikutnya."""
+    _wakeup.set()
+
+
+def _retry_delay(attempts):
+    # Backoff eksponensial: 2, 4, 8, ... detik, maksimal 5 menit
+    return timedelta(seconds=min(2 ** attempts, 300))
+
+
+def claim_events(limit=OUTBOX_BATCH_SIZE):
+    """Ambil event yang siap diproses dan tandai sebagai 'processing'.
+
+    Memakai SELECT ... FOR UPDATE SKIP LOCKED sehingga beberapa worker
+    (thread maupun proses lain) tidak mengambil event yang sama.
+    """
+    db: Session = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        events = (
+            db.query(OrderEvent)
+            .filter(
+                or_(
+                    (OrderEvent.status == "pending") & (OrderEvent.available_at <= now),
+                    (OrderEvent.status == "processing") & (OrderEvent.locked_at < now - OUTBOX_LOCK_TIMEOUT),
+                )
+            )
+            .order_by(OrderEvent.event_id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        claimed = []
+        for event in events:
+            event.status = "processing"
+            event.attempts += 1
+            event.locked_at = now
+            claimed.append((event.event_id, event.order_id, event.event_type, event.handler, event.payload, event.attempts))
+        db.commit()
+        return claimed
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def process_event(event_id, order_id, event_type, handler_name, payload, attempts):
+    """Jalankan handler milik satu baris outbox lalu simpan hasilnya."""
+    error = None
+    handler = _handlers.get(event_type, {}).get(handler_name)
+    if handler is None:
+        error = f"Handler '{handler_name}' untuk {event_type} tidak terdaftar"
+        # Tidak ada gunanya retry: langsung gagal
+        attempts = OUTBOX_MAX_ATTEMPTS
+    else:
+        try:
+            handler(order_id, json.loads(payload) if payload else {})
+        except Exception as e:
+            logger.exception("Event %s (%s/%s) gagal diproses", event_id, event_type, handler_name)
+            error = str(e)
+
+    db: Session = SessionLocal()
+    try:
+        event = db.query(OrderEvent).filter(OrderEvent.event_id == event_id).first()
+        if not event:
+            return
+        event.locked_at = None
+        if error is None:
+            event.status = "done"
+            event.last_error = None
+        elif attempts >= OUTBOX_MAX_ATTEMPTS:
+            event.status = "failed"
+            event.last_error = error
+        else:
+            event.status = "pending"
+            event.last_error = error
+            event.available_at = datetime.utcnow() + _retry_delay(attempts)
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception("Gagal menyimpan status event %s", event_id)
+    finally:
+        db.close()
+
+
+class OutboxWorker:
+    """Polling outbox dan proses event memakai thread pool."""
+
+    def __init__(self, workers=OUTBOX_WORKERS, poll_seconds=OUTBOX_POLL_SECONDS):
+        self.workers = workers
+        self.poll_seconds = poll_seconds
+        self._stop = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def run_once(self, executor):
+        claimed = claim_events(limit=self.workers * OUTBOX_BATCH_SIZE)
+        futures = [executor.submit(process_event, *event) for event in claimed]
+        for future in futures:
+            future.result()
+        return len(claimed)
+
+    def run_forever(self):
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="outbox") as executor:
+            while not self._stop.is_set():
+                try:
+                    processed = self.run_once(executor)
+                except Exception:
+                    logger.exception("Polling outbox gagal")
+                    processed = 0
+                if not processed:
+                    _wakeup.wait(self.poll_seconds)
+                    _wakeup.clear()
+
+    def start(self):
+        """Jalankan worker di background thread (mode in-process); aman dipanggil berulang."""
+        if self._thread and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.run_forever, name="outbox-poller", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        _wakeup.set()
+        if self._thread:
+            self._thread.join()
+
+
+# --- Handler bawaan ---
+@register_handler("order.created")
+def log_order_created(order_id, payload):
+    # Tempat side-effect setelah order (email struk, tiket dapur, analytics)
+    logger.info("Order %s dibuat: total %s, %s item", order_id, payload.get("total_price"), payload.get("item_count"))
@@ -0,0 +1,44 @@
+import os
+import sys
+
+import pytest
+
+# config.database membutuhkan DATABASE_URL saat di-import; test memakai SQLite in-memory
+# Selalu timpa: jangan pernah menjalankan create_all / test pada DATABASE_URL sungguhan
+os.environ["DATABASE_URL"] = "sqlite://"
+# Cache respons aktif (mode memori) agar invalidasi ikut teruji
+os.environ["RESPONSE_CACHE_ENABLED"] = "1"
+os.environ.pop("RESPONSE_CACHE_SQLITE", None)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def app():
+    from config.database import engine
+    engine.echo = False
+    # import app menjalankan Base.metadata.create_all
+    from app import app as flask_app
+    flask_app.config["TESTING"] = True
+    return flask_app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def db(app):
+    """Session ke database test yang dikosongkan sebelum setiap test."""
+    from config.cache import response_cache
+    from config.database import Base, SessionLocal, engine
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+    # id dipakai ulang antar test: buang entry cache dari test sebelumnya
+    response_cache.invalidate_all()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
@@ -0,0 +1,146 @@
+import pytest
+from sqlalchemy import event
+
+from config.database import SessionLocal
+from models.customer_model import Customer
+from models.menu_model import Menu
+from models.order_item_model import OrderItem
+from models.order_model import Order
+
+
+def _menu(name, price=10000, **kwargs):
+    return {"name": name, "price": price, "category": "makanan", "image_url": "", **kwargs}
+
+
+@pytest.fixture
+def menus(db):
+    db.add_all([
+        Menu(id_menu=1, name="Nasi Goreng", price=20000, category="makanan", image_url=""),
+        Menu(id_menu=2, name="Es Teh", price=5000, category="minuman", image_url=""),
+        Menu(id_menu=3, name="Roti", price=8000, category="makanan", image_url=""),
+    ])
+    db.commit()
+
+
+@pytest.fixture
+def invalidations(monkeypatch):
+    calls = []
+    monkeypatch.setattr("controllers.menu_controller.response_cache.invalidate_all", lambda: calls.append(1))
+    return calls
+
+
+@pytest.fixture
+def commits():
+    calls = []
+
+    def on_commit(session):
+        calls.append(1)
+
+    event.listen(SessionLocal, "after_commit", on_commit)
+    yield calls
+    event.remove(SessionLocal, "after_commit", on_commit)
+
+
+def _names(db):
+    db.expire_all()
+    return {m.id_menu: (m.name, m.price) for m in db.query(Menu)}
+
+
+def test_bulk_upsert_and_delete_in_one_commit(client, db, menus, invalidations, commits):
+    resp = client.put("/menus/bulk", json={
+        "upsert": [
+            {"id_menu": 1, "price": 21000},
+            {"name": "Es Teh", "price": 6000},
+            _menu("Mie Ayam", 18000),
+        ],
+        "delete": [3],
+    })
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert [m["name"] for m in body["created"]] == ["Mie Ayam"]
+    assert sorted(m["id_menu"] for m in body["updated"]) == [1, 2]
+    assert body["deleted"] == 1
+
+    assert len(commits) == 1
+    assert len(invalidations) == 1
+    names = _names(db)
+    assert names[1] == ("Nasi Goreng", 21000)
+    assert names[2] == ("Es Teh", 6000)
+    assert 3 not in names
+
+
+def test_create_only_batch_does_not_invalidate(client, db, menus, invalidations):
+    resp = client.put("/menus/bulk", json={"upsert": [_menu("Baru")]})
+    assert resp.status_code == 200
+    assert invalidations == []
+
+
+def test_upsert_and_delete_same_menu_is_rejected(client, db, menus, invalidations):
+    resp = client.put("/menus/bulk", json={"upsert": [{"id_menu": 3, "price": 2}], "delete": [3]})
+    assert resp.status_code == 400
+    assert resp.get_json()["ids"] == [3]
+    # by name yang mengarah ke menu yang dihapus juga ditolak
+    resp = client.put("/menus/bulk", json={"upsert": [{"name": "Roti", "price": 2}], "delete": [3]})
+    assert resp.status_code == 400
+    assert _names(db)[3] == ("Roti", 8000)
+    assert invalidations == []
+
+
+@pytest.mark.parametrize("upserts", [
+    [_menu("Roti Bakar"), {"name": "Roti Bakar", "price": 7000}],
+    [{"id_menu": 1, "price": 1}, {"name": "Nasi Goreng", "price": 2}],
+    [{"id_menu": 2, "price": 1}, {"id_menu": "2", "price": 2}],
+])
+def test_same_menu_twice_in_batch_is_rejected(client, db, menus, upserts):
+    resp = client.put("/menus/bulk", json={"upsert": upserts})
+    assert resp.status_code == 400
+    assert "lebih dari sekali" in resp.get_json()["message"]
+    db.expire_all()
+    assert db.query(Menu).count() == 3
+
+
+def test_delete_menu_used_by_order_returns_409(client, db, menus):
+    db.add(Customer(customer_id=1, name_customer="a", email="a@x", password="p", address="a", phone="1"))
+    db.add(Order(order_id=1, customer_id=1, total_price=20000, payment_method="cash", status="diantar"))
+    db.add(OrderItem(order_id=1, menu_id=1, quantity=1, price=20000, subtotal=20000))
+    db.commit()
+
+    resp = client.put("/menus/bulk", json={"upsert": [{"id_menu": 2, "price": 1}], "delete": [1, 3]})
+    assert resp.status_code == 409
+    assert resp.get_json()["ids"] == [1]
+    names = _names(db)
+    assert 3 in names
+    assert names[2] == ("Es Teh", 5000)
+
+
+def test_ambiguous_name_returns_409(client, db, menus):
+    db.add(Menu(id_menu=4, name="Roti", price=9000, category="makanan", image_url=""))
+    db.commit()
+    resp = client.put("/menus/bulk", json={"upsert": [{"name": "Roti", "price": 1}]})
+    assert resp.status_code == 409
+    assert resp.get_json()["names"] == ["Roti"]
+
+
+def test_unknown_id_returns_404(client, db, menus):
+    resp = client.put("/menus/bulk", json={"upsert": [{"id_menu": 99, "price": 1}]})
+    assert resp.status_code == 404
+
+
+@pytest.mark.parametrize("payload, message", [
+    ([1], "Body harus berupa objek JSON"),
+    ({"upsert": {"name": "x"}}, "Field 'upsert' dan 'delete' harus berupa daftar"),
+    ({"upsert": [1]}, "Setiap item 'upsert' harus berupa objek"),
+    ({"upsert": [_menu(["a"])]}, "Field 'name' harus berupa teks"),
+    ({"upsert": [_menu("a", price="mahal")]}, "Field 'price' harus angka bulat"),
+    ({"upsert": [_menu("a", price=True)]}, "Field 'price' harus angka bulat"),
+    ({"upsert": [{"id_menu": "x", "price": 1}]}, "id_menu harus angka"),
+    ({"upsert": [{"id_menu": 1.9, "price": 1}]}, "id_menu harus angka"),
+    ({"delete": [2.7]}, "Isi 'delete' harus berupa id_menu (angka)"),
+    ({"upsert": [{"name": "Baru", "price": 1}]}, "Data tidak lengkap"),
+])
+def test_invalid_input_returns_400(client, db, menus, payload, message):
+    resp = client.put("/menus/bulk", json=payload)
+    assert resp.status_code == 400
+    assert resp.get_json()["message"] == message
+    assert _names(db)[1] == ("Nasi Goreng", 20000)
+    assert _names(db)[2] == ("Es Teh", 5000)
@@ -0,0 +1,160 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from models.customer_model import Customer
+from models.menu_model import Menu
+from models.order_event_model import OrderEvent
+from models.order_model import Order
+from services import outbox_worker
+
+
+@pytest.fixture
+def handlers(monkeypatch):
+    """Registry handler kosong untuk test; dikembalikan setelah test selesai."""
+    monkeypatch.setattr(outbox_worker, "_handlers", {})
+    return outbox_worker._handlers
+
+
+def _enqueue(db, event_type="test.event", order_id=1):
+    events = outbox_worker.enqueue_event(db, order_id, event_type, {"n": 1})
+    db.commit()
+    return [e.event_id for e in events]
+
+
+def _process_claimed():
+    claimed = outbox_worker.claim_events()
+    for event in claimed:
+        outbox_worker.process_event(*event)
+    return claimed
+
+
+def _event(db, event_id):
+    db.expire_all()
+    return db.query(OrderEvent).filter(OrderEvent.event_id == event_id).one()
+
+
+def _make_due(db, event_id):
+    event = _event(db, event_id)
+    event.available_at = datetime.utcnow() - timedelta(seconds=1)
+    db.commit()
+
+
+def test_enqueue_creates_one_row_per_handler(db, handlers):
+    outbox_worker.register_handler("test.event")(lambda order_id, payload: None)
+    outbox_worker.register_handler("test.event", name="kitchen")(lambda order_id, payload: None)
+    ids = _enqueue(db)
+    assert sorted(_event(db, i).handler for i in ids) == ["<lambda>", "kitchen"]
+
+
+def test_failing_handler_backs_off_without_rerunning_others(db, handlers):
+    calls = []
+
+    @outbox_worker.register_handler("test.event")
+    def receipt(order_id, payload):
+        calls.append("receipt")
+
+    @outbox_worker.register_handler("test.event")
+    def analytics(order_id, payload):
+        calls.append("analytics")
+        raise RuntimeError("analytics down")
+
+    ids = _enqueue(db)
+    before = datetime.utcnow()
+    _process_claimed()
+
+    receipt_row, analytics_row = (_event(db, i) for i in ids)
+    assert receipt_row.status == "done"
+    assert analytics_row.status == "pending"
+    assert analytics_row.attempts == 1
+    assert analytics_row.last_error == "analytics down"
+    # backoff percobaan pertama: 2 detik
+    delay = analytics_row.available_at - before
+    assert timedelta(seconds=1) < delay <= timedelta(seconds=3)
+
+    # belum jatuh tempo: tidak diambil lagi
+    assert outbox_worker.claim_events() == []
+
+    _make_due(db, ids[1])
+    _process_claimed()
+    assert calls == ["receipt", "analytics", "analytics"]
+
+
+def test_event_fails_after_max_attempts(db, handlers, monkeypatch):
+    monkeypatch.setattr(outbox_worker, "OUTBOX_MAX_ATTEMPTS", 2)
+
+    @outbox_worker.register_handler("test.event")
+    def always_fails(order_id, payload):
+        raise RuntimeError("boom")
+
+    (event_id,) = _enqueue(db)
+    _process_claimed()
+    assert _event(db, event_id).status == "pending"
+
+    _make_due(db, event_id)
+    _process_claimed()
+    event = _event(db, event_id)
+    assert event.status == "failed"
+    assert event.attempts == 2
+
+    _make_due(db, event_id)
+    assert outbox_worker.claim_events() == []
+
+
+def test_stale_processing_rows_are_reclaimed(db, handlers):
+    outbox_worker.register_handler("test.event")(lambda order_id, payload: None)
+    stale_id, fresh_id = _enqueue(db), _enqueue(db)
+    stale_id, fresh_id = stale_id[0], fresh_id[0]
+
+    now = datetime.utcnow()
+    for event_id, locked_at in ((stale_id, now - outbox_worker.OUTBOX_LOCK_TIMEOUT - timedelta(seconds=1)),
+                                (fresh_id, now)):
+        event = _event(db, event_id)
+        event.status = "processing"
+        event.attempts = 1
+        event.locked_at = locked_at
+        db.commit()
+
+    claimed = outbox_worker.claim_events()
+    assert [c[0] for c in claimed] == [stale_id]
+    assert claimed[0][-1] == 2
+
+
+def test_unknown_handler_fails_immediately(db, handlers):
+    outbox_worker.register_handler("test.event", name="gone")(lambda order_id, payload: None)
+    (event_id,) = _enqueue(db)
+    handlers.clear()
+    _process_claimed()
+    assert _event(db, event_id).status == "failed"
+
+
+def _seed_order_data(db):
+    db.add(Customer(customer_id=1, name_customer="a", email="a@x", password="p", address="a", phone="1"))
+    db.add(Menu(id_menu=1, name="Kopi", price=15000, category="minuman", image_url=""))
+    db.commit()
+
+
+def test_create_order_writes_order_and_events_together(client, db, handlers):
+    outbox_worker.register_handler("order.created")(lambda order_id, payload: None)
+    _seed_order_data(db)
+
+    resp = client.post("/orders", json={"customer_id": 1, "payment_method": "cash", "items": [{"menu_id": 1, "quantity": 2}]})
+    assert resp.status_code == 201
+
+    event = db.query(OrderEvent).one()
+    assert event.order_id == resp.get_json()["order_id"]
+    assert event.event_type == "order.created"
+    assert event.status == "pending"
+
+
+def test_create_order_rolls_back_order_when_enqueue_fails(client, db, handlers, monkeypatch):
+    _seed_order_data(db)
+
+    def broken_enqueue(*args, **kwargs):
+        raise RuntimeError("outbox unavailable")
+
+    monkeypatch.setattr("controllers.order_controller.enqueue_event", broken_enqueue)
+    resp = client.post("/orders", json={"customer_id": 1, "payment_method": "cash", "items": [{"menu_id": 1, "quantity": 2}]})
+    assert resp.status_code == 500
+    assert db.query(Order).count() == 0
+    assert db.query(OrderEvent).count() == 0
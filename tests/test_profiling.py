@@ -0,0 +1,42 @@
+import time
+
+from flask import Flask
+
+from config.profiling import init_profiling
+
+
+def _profiled_app(monkeypatch, tmp_path, interval_ms):
+    monkeypatch.setenv("PROFILE_TOKEN", "rahasia")
+    monkeypatch.setenv("PROFILE_DIR", str(tmp_path))
+    monkeypatch.setenv("PROFILE_INTERVAL_MS", str(interval_ms))
+    app = Flask(__name__)
+
+    @app.route("/slow")
+    def slow():
+        time.sleep(0.05)
+        return "ok"
+
+    init_profiling(app)
+    return app.test_client()
+
+
+def test_profiled_request_writes_folded_stacks(monkeypatch, tmp_path):
+    client = _profiled_app(monkeypatch, tmp_path, interval_ms=1)
+    resp = client.get("/slow", headers={"X-Profile-Token": "rahasia"})
+    name = resp.headers["X-Profile-Id"]
+    content = (tmp_path / f"{name}.folded").read_text()
+    assert "slow (test_profiling.py" in content
+
+
+def test_wrong_token_is_not_profiled(monkeypatch, tmp_path):
+    client = _profiled_app(monkeypatch, tmp_path, interval_ms=1)
+    resp = client.get("/slow", headers={"X-Profile-Token": "salah"})
+    assert "X-Profile-Id" not in resp.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_request_without_samples_writes_nothing(monkeypatch, tmp_path):
+    client = _profiled_app(monkeypatch, tmp_path, interval_ms=10000)
+    resp = client.get("/slow", headers={"X-Profile-Token": "rahasia"})
+    assert "X-Profile-Id" not in resp.headers
+    assert list(tmp_path.iterdir()) == []
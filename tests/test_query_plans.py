@@ -0,0 +1,42 @@
+"""Query panas di order_controller / customer_controller harus memakai index, bukan full scan."""
+from sqlalchemy import text
+
+from config.database import engine
+from models.menu_model import Menu
+from models.order_item_model import OrderItem
+from models.order_model import Order
+
+
+def _plan(db, query):
+    sql = str(query.statement.compile(bind=engine, compile_kwargs={"literal_binds": True}))
+    rows = db.execute(text(f"EXPLAIN QUERY PLAN {sql}")).fetchall()
+    return [row[-1] for row in rows]
+
+
+def _uses_index(plan, table, index):
+    prefixes = (f"SEARCH {table} USING INDEX {index} ", f"SEARCH {table} USING COVERING INDEX {index} ")
+    return any(p.startswith(prefixes) for p in plan)
+
+
+def test_order_items_by_order_id_use_index(db):
+    # get_order_by_id / get_all_order / get_customer_by_id: item per order + join menu
+    query = (
+        db.query(OrderItem, Menu)
+        .join(Menu, OrderItem.menu_id == Menu.id_menu)
+        .filter(OrderItem.order_id == 1)
+    )
+    plan = _plan(db, query)
+    assert _uses_index(plan, "order_item", "ix_order_item_order_id_menu_id"), plan
+    assert not any(p.startswith("SCAN") for p in plan), plan
+
+
+def test_orders_by_customer_id_use_index(db):
+    # get_all_customers / get_customer_by_id
+    plan = _plan(db, db.query(Order).filter(Order.customer_id == 1))
+    assert _uses_index(plan, "order", "ix_order_customer_id"), plan
+
+
+def test_order_items_by_menu_id_use_index(db):
+    # pemakaian menu (mis. cek sebelum hapus menu)
+    plan = _plan(db, db.query(OrderItem.order_item_id).filter(OrderItem.menu_id == 1))
+    assert _uses_index(plan, "order_item", "ix_order_item_menu_id"), plan
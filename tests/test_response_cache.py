@@ -0,0 +1,174 @@
+import sqlite3
+import time
+
+import pytest
+
+from config.cache import ResponseCache, _cache_from_env, response_cache
+from models.customer_model import Customer
+from models.menu_model import Menu
+
+
+def _loader(calls, value):
+    def load():
+        calls.append(value)
+        return value
+    return load
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    path = str(tmp_path / "cache.db") if request.param == "sqlite" else None
+    return ResponseCache(max_entries=2, sqlite_path=path)
+
+
+def test_hit_after_first_load(cache):
+    calls = []
+    assert cache.get_or_set("order", 1, _loader(calls, {"id": 1})) == {"id": 1}
+    assert cache.get_or_set("order", 1, _loader(calls, {"id": 1})) == {"id": 1}
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats["hits_memory"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+
+
+def test_missing_entity_is_not_cached(cache):
+    calls = []
+    cache.get_or_set("order", 1, _loader(calls, None))
+    cache.get_or_set("order", 1, _loader(calls, None))
+    assert len(calls) == 2
+
+
+def test_invalidate_and_invalidate_all(cache):
+    calls = []
+    cache.get_or_set("order", 1, _loader(calls, "a"))
+    cache.invalidate("order", 1)
+    assert cache.get_or_set("order", 1, _loader(calls, "b")) == "b"
+    cache.invalidate_all()
+    assert cache.get_or_set("order", 1, _loader(calls, "c")) == "c"
+    assert calls == ["a", "b", "c"]
+
+
+def test_write_during_load_makes_entry_stale(cache):
+    calls = []
+
+    def load_then_concurrent_write():
+        calls.append("old")
+        # write lain commit saat loader masih berjalan
+        cache.invalidate("customer", 1)
+        return "old"
+
+    assert cache.get_or_set("customer", 1, load_then_concurrent_write) == "old"
+    assert cache.get_or_set("customer", 1, _loader(calls, "new")) == "new"
+    assert calls == ["old", "new"]
+
+
+def test_lru_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    calls = []
+    cache.get_or_set("order", 1, _loader(calls, 1))
+    cache.get_or_set("order", 2, _loader(calls, 2))
+    cache.get_or_set("order", 1, _loader(calls, 1))  # order 1 jadi paling baru
+    cache.get_or_set("order", 3, _loader(calls, 3))  # order 2 dibuang
+    assert cache.stats()["size"] == 2
+    cache.get_or_set("order", 1, _loader(calls, 1))
+    cache.get_or_set("order", 2, _loader(calls, 2))
+    assert calls == [1, 2, 3, 2]
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    for path in (None, str(tmp_path / "cache.db")):
+        cache = ResponseCache(sqlite_path=path, ttl=0.05)
+        calls = []
+        cache.get_or_set("order", 1, _loader(calls, "a"))
+        cache.get_or_set("order", 1, _loader(calls, "a"))
+        time.sleep(0.1)
+        cache.get_or_set("order", 1, _loader(calls, "b"))
+        assert calls == ["a", "b"]
+
+
+def test_shared_backend_is_seen_by_other_process(tmp_path):
+    path = str(tmp_path / "cache.db")
+    worker_a, worker_b = ResponseCache(sqlite_path=path), ResponseCache(sqlite_path=path)
+    calls = []
+    worker_a.get_or_set("order", 1, _loader(calls, "a"))
+    assert worker_b.get_or_set("order", 1, _loader(calls, "b")) == "a"
+    assert worker_b.stats()["hits_shared"] == 1
+    # invalidasi dari worker B juga berlaku untuk entry memori worker A
+    worker_b.invalidate("order", 1)
+    assert worker_a.get_or_set("order", 1, _loader(calls, "c")) == "c"
+
+
+def test_unshared_payload_never_written_to_sqlite(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = ResponseCache(sqlite_path=path)
+    calls = []
+    cache.get_or_set("customer", 1, _loader(calls, {"password": "rahasia"}), shared=False)
+    cache.get_or_set("customer", 1, _loader(calls, {"password": "rahasia"}), shared=False)
+    assert len(calls) == 1
+    rows = sqlite3.connect(path).execute("SELECT key, value FROM cache_entry").fetchall()
+    assert rows == []
+
+    # versi tetap dari backend bersama: invalidasi worker lain tetap berlaku
+    ResponseCache(sqlite_path=path).invalidate("customer", 1)
+    cache.get_or_set("customer", 1, _loader(calls, {"password": "baru"}), shared=False)
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("env, enabled", [
+    ({}, False),
+    ({"RESPONSE_CACHE_ENABLED": "1"}, True),
+    ({"RESPONSE_CACHE_SQLITE": "{path}"}, True),
+    ({"RESPONSE_CACHE_SQLITE": "{path}", "RESPONSE_CACHE_ENABLED": "0"}, False),
+])
+def test_enabled_by_default_only_with_shared_backend(tmp_path, env, enabled):
+    env = {k: v.format(path=tmp_path / "cache.db") for k, v in env.items()}
+    assert _cache_from_env(env).enabled is enabled
+
+
+# --- Invalidasi dari controller ---
+
+@pytest.fixture
+def order_data(client, db):
+    db.add(Customer(customer_id=1, name_customer="Ani", email="ani@x", password="p", address="a", phone="1"))
+    db.add(Menu(id_menu=1, name="Kopi", price=15000, category="minuman", image_url=""))
+    db.commit()
+    resp = client.post("/orders", json={"customer_id": 1, "payment_method": "cash", "items": [{"menu_id": 1, "quantity": 1}]})
+    return resp.get_json()["order_id"]
+
+
+def _get(client, url):
+    resp = client.get(url)
+    assert resp.status_code == 200
+    return resp.get_json()
+
+
+def test_order_detail_is_cached(client, order_data):
+    before = response_cache.stats()["hits_memory"]
+    _get(client, f"/orders/{order_data}")
+    _get(client, f"/orders/{order_data}")
+    assert response_cache.stats()["hits_memory"] == before + 1
+
+
+def test_create_order_invalidates_customer(client, order_data):
+    assert len(_get(client, "/customers/1")["orders"]) == 1
+    client.post("/orders", json={"customer_id": 1, "payment_method": "cash", "items": [{"menu_id": 1, "quantity": 2}]})
+    assert len(_get(client, "/customers/1")["orders"]) == 2
+
+
+def test_update_customer_invalidates_customer(client, order_data):
+    assert _get(client, "/customers/1")["name_customer"] == "Ani"
+    client.put("/customers/1", json={"name_customer": "Budi"})
+    assert _get(client, "/customers/1")["name_customer"] == "Budi"
+
+
+def test_update_menu_bumps_global_version(client, order_data):
+    assert _get(client, f"/orders/{order_data}")["items"][0]["menu_name"] == "Kopi"
+    assert _get(client, "/customers/1")["orders"][0]["items"][0]["menu_name"] == "Kopi"
+    client.put("/menus/1", json={"name": "Kopi Susu"})
+    assert _get(client, f"/orders/{order_data}")["items"][0]["menu_name"] == "Kopi Susu"
+    assert _get(client, "/customers/1")["orders"][0]["items"][0]["menu_name"] == "Kopi Susu"
+
+
+def test_bulk_menus_bumps_global_version(client, order_data):
+    assert _get(client, f"/orders/{order_data}")["items"][0]["menu_name"] == "Kopi"
+    client.put("/menus/bulk", json={"upsert": [{"id_menu": 1, "name": "Kopi Hitam"}]})
+    assert _get(client, f"/orders/{order_data}")["items"][0]["menu_name"] == "Kopi Hitam"